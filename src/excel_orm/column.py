@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+import re
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
+from types import MemberDescriptorType
 from typing import Any, TypeVar
 
 T = TypeVar("T")
 
 
+def _no_validation(_value: Any) -> None:
+    return None
+
+
 @dataclass(frozen=True)
 class ColumnSpec[T]:
     header: str | None = None  # header string in Excel
@@ -16,7 +23,7 @@ class ColumnSpec[T]:
     excludes: set[Any] | None = None  # raw values that mark row as excluded
     parser: Callable[[Any], T] = lambda x: x  # raw -> parsed
     renderer: Callable[[T | None], Any] = lambda x: x  # parsed -> raw
-    validator: Callable[[T | None], None] = lambda _: None
+    validator: Callable[[T | None], None] = _no_validation
 
 
 class Column[T]:
@@ -25,30 +32,106 @@ class Column[T]:
 
     def __set_name__(self, owner, name: str):
         self.name = name
+        # values live in a per-field instance attribute (or a slot of the same name)
+        self.storage_name = f"_col_{name}"
+        # anything else under that name would be overwritten by, or intercept, the stored value;
+        # a slot declared for it is the one thing allowed to be there
+        for klass in owner.__mro__:
+            if self.storage_name in klass.__dict__ and not isinstance(
+                klass.__dict__[self.storage_name], MemberDescriptorType
+            ):
+                raise ValueError(
+                    f"{owner.__name__}.{name} stores its value in '{self.storage_name}', "
+                    "which is already defined on the model."
+                )
         # register in definition order
         reg = owner.__dict__.get("__columns__")
         if reg is None:
             owner.__columns__ = []
+        elif any(c.name == self.storage_name or c.storage_name == name for c in reg):
+            raise ValueError(
+                f"{owner.__name__}.{name} collides with the storage of another column."
+            )
         owner.__columns__.append(self)
 
     def __get__(self, obj, objtype=None) -> T | Column | None:
         if obj is None:
             return self
-        return obj._values.get(self.name)  # centralized storage
+        return getattr(obj, self.storage_name, None)
 
     def __set__(self, obj, value: T | None):
         self.validate(value)
-        obj._values[self.name] = value
+        setattr(obj, self.storage_name, value)
 
     def parse_cell(self, raw: Any) -> T | None:
         return self.spec.parser(raw)
 
+    def parse_cells(self, raws: Sequence[Any]) -> list[T]:
+        parser = self.spec.parser
+        # built-in parsers carry a whole-column variant; swapping the parser drops it
+        batch = getattr(parser, "batch", None)
+        if batch is not None:
+            return batch(raws)
+        return [parser(raw) for raw in raws]
+
     def validate(self, value: T | None) -> None:
         if self.spec.not_null and (value is None or value == ""):
             raise ValueError(f"{self.name} cannot be null/empty")
         self.spec.validator(value)
 
 
+_DATE_FORMATS: tuple[str, ...] = (
+    "%d-%b-%Y",  # 01-JUN-2025  (your requirement)
+    "%d-%b-%y",  # 01-JUN-25
+    "%d %b %Y",  # 01 JUN 2025
+    "%d %b %y",  # 01 JUN 25
+    "%d/%b/%Y",  # 01/JUN/2025
+    "%Y-%m-%d",  # 2025-06-01
+    "%Y/%m/%d",  # 2025/06/01
+    "%m/%d/%Y",  # 06/01/2025
+    "%m/%d/%y",  # 06/01/25
+    "%d/%m/%Y",  # 01/06/2025
+    "%d/%m/%y",  # 01/06/25
+)
+
+# Classify a string's shape with one regex so only the formats that can match it are tried.
+# Each alternative is a named group; `lastgroup` says which one fired.
+_DATE_SHAPE_RE = re.compile(
+    r"(?P<day_mon>\d{1,2}[-/\s]+[A-Z]{3}[-/\s]+\d{2,4})"
+    r"|(?P<year_first>\d{4}[-/]\d{1,2}[-/]\d{1,2})"
+    r"|(?P<slashed>\d{1,2}/\d{1,2}/\d{2,4})"
+)
+_DATE_FORMATS_BY_SHAPE: dict[str, tuple[str, ...]] = {
+    "day_mon": _DATE_FORMATS[0:5],
+    "year_first": _DATE_FORMATS[5:7],
+    "slashed": _DATE_FORMATS[7:11],  # month-first tried before day-first, as above
+}
+
+
+def _parse_date_str_impl(s: str) -> date | None:
+    # 1) ISO-8601 fast path (handles "2025-06-01" and "2025-06-01T13:45:00", etc.)
+    try:
+        return datetime.fromisoformat(s).date()
+    except ValueError:
+        pass
+
+    # 2) Try known patterns (case-insensitive month abbreviations like JUN)
+    s_norm = s.upper()
+    shape = _DATE_SHAPE_RE.fullmatch(s_norm)
+    # unrecognized shapes still get the full cascade
+    formats = _DATE_FORMATS_BY_SHAPE[shape.lastgroup] if shape else _DATE_FORMATS
+    for fmt in formats:
+        try:
+            return datetime.strptime(s_norm, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+# exports repeat the same dates heavily; bounded so unique-heavy inputs can't grow it forever
+_parse_date_str = lru_cache(maxsize=8192)(_parse_date_str_impl)
+
+
 def text_column(
     header: str | None = None,
     *,
@@ -59,10 +142,10 @@ def text_column(
     def parse(raw: Any) -> str:
         if raw is None:
             return ""
-        s = str(raw)
-        if strip:
-            s = s.strip()
-        return s
+        # openpyxl hands back plain str for text cells; skip the str() copy for those.
+        # str.strip() returns the same object when there is nothing to trim.
+        s = raw if type(raw) is str else str(raw)
+        return s.strip() if strip else s
 
     return Column(
         ColumnSpec[str](
@@ -86,6 +169,12 @@ def int_column(
             return 0
         return int(raw)
 
+    def parse_many(raws: Sequence[Any]) -> list[int]:
+        # numeric cells already arrive as int; only coerce the rest
+        return [raw if type(raw) is int else parse(raw) for raw in raws]
+
+    parse.batch = parse_many  # ty:ignore[unresolved-attribute]
+
     return Column(
         ColumnSpec[int](
             header=header,
@@ -96,18 +185,36 @@ def int_column(
     )
 
 
+_BOOL_MAP: dict[str, bool] = {
+    "true": True,
+    "t": True,
+    "yes": True,
+    "y": True,
+    "1": True,
+    "false": False,
+    "f": False,
+    "no": False,
+    "n": False,
+    "0": False,
+}
+
+
 def bool_column(header: str | None = None, *, default: bool | None = None):
     def parse(raw: Any) -> bool:
-        if raw is None or raw == "":
-            return False
         if isinstance(raw, bool):
             return raw
-        s = str(raw).strip().lower()
-        if s in {"true", "t", "yes", "y", "1"}:
-            return True
-        if s in {"false", "f", "no", "n", "0"}:
+        if raw is None or raw == "":
             return False
-        raise ValueError(f"Invalid boolean: {raw}")
+        try:
+            return _BOOL_MAP[str(raw).strip().lower()]
+        except KeyError:
+            raise ValueError(f"Invalid boolean: {raw}") from None
+
+    def parse_many(raws: Sequence[Any]) -> list[bool]:
+        # TRUE/FALSE cells already arrive as bool; only coerce the rest
+        return [raw if type(raw) is bool else parse(raw) for raw in raws]
+
+    parse.batch = parse_many  # ty:ignore[unresolved-attribute]
 
     return Column(
         ColumnSpec[bool](
@@ -119,20 +226,6 @@ def bool_column(header: str | None = None, *, default: bool | None = None):
 
 
 def date_column(header: str | None = None, *, default: date | None = None):
-    _DATE_FORMATS: tuple[str, ...] = (
-        "%d-%b-%Y",  # 01-JUN-2025  (your requirement)
-        "%d-%b-%y",  # 01-JUN-25
-        "%d %b %Y",  # 01 JUN 2025
-        "%d %b %y",  # 01 JUN 25
-        "%d/%b/%Y",  # 01/JUN/2025
-        "%Y-%m-%d",  # 2025-06-01
-        "%Y/%m/%d",  # 2025/06/01
-        "%m/%d/%Y",  # 06/01/2025
-        "%m/%d/%y",  # 06/01/25
-        "%d/%m/%Y",  # 01/06/2025
-        "%d/%m/%y",  # 01/06/25
-    )
-
     def parse(raw: Any) -> date:
         if raw is None or raw == "":
             raise ValueError("Date Value was empty")
@@ -143,27 +236,21 @@ def date_column(header: str | None = None, *, default: date | None = None):
         if isinstance(raw, datetime):
             return raw.date()
 
-        s = str(raw).strip()
+        s = raw.strip() if isinstance(raw, str) else str(raw).strip()
         if s == "":
             raise ValueError("Date Value was empty")
 
-        # 1) ISO-8601 fast path (handles "2025-06-01" and "2025-06-01T13:45:00", etc.)
-        try:
-            dt = datetime.fromisoformat(s)
-            return dt.date()
-        except ValueError:
-            pass
-
-        # 2) Try known patterns (case-insensitive month abbreviations like JUN)
-        s_norm = s.upper()
+        parsed = _parse_date_str(s)
+        if parsed is None:
+            raise ValueError(f"Invalid date value: {raw!r}")
+        return parsed
 
-        for fmt in _DATE_FORMATS:
-            try:
-                return datetime.strptime(s_norm, fmt).date()
-            except ValueError:
-                continue
+    def parse_many(raws: Sequence[Any]) -> list[date]:
+        # date columns repeat heavily; parse each distinct raw value once
+        parsed = {raw: parse(raw) for raw in dict.fromkeys(raws)}
+        return [parsed[raw] for raw in raws]
 
-        raise ValueError(f"Invalid date value: {raw!r}")
+    parse.batch = parse_many  # ty:ignore[unresolved-attribute]
 
     return Column(
         ColumnSpec[date](
@@ -1,22 +1,29 @@
 from __future__ import annotations
 
+import operator
 import re
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from functools import cache
+from itertools import compress
 from typing import Any, TypeVar
 
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Alignment, Font
+from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
 
-from .column import Column
+from .column import Column, _no_validation
 
 M = TypeVar("M")
 
 
+_CAMEL1 = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL2 = re.compile(r"([a-z0-9])([A-Z])")
+
+
 def _camel_to_snake(name: str) -> str:
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    s2 = re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1)
-    return s2.lower()
+    return _CAMEL2.sub(r"\1_\2", _CAMEL1.sub(r"\1_\2", name)).lower()
 
 
 def _pluralize(s: str) -> str:
@@ -26,17 +33,72 @@ def _pluralize(s: str) -> str:
     return s + "s"
 
 
+@cache
 def _repo_name_for_model(model: type[Any]) -> str:
     return _pluralize(_camel_to_snake(model.__name__))
 
 
+@cache
 def _display_name_for_model(model: type[Any]) -> str:
     # "manufacturing_plants" -> "Manufacturing Plants"
     return _repo_name_for_model(model).replace("_", " ").title()
 
 
-def _get_model_columns(model: type[Any]) -> list[Column[Any]]:
-    return list(getattr(model, "__columns__", []))
+@cache
+def _get_model_columns(model: type[Any]) -> tuple[Column[Any], ...]:
+    return tuple(getattr(model, "__columns__", ()))
+
+
+@dataclass(frozen=True, slots=True)
+class _ModelPlan:
+    """Per-model column data flattened into plain tuples for the parse loop."""
+
+    columns: tuple[Column[Any], ...]
+    defaults: tuple[Any, ...]
+    parsers: tuple[Callable[[Sequence[Any]], list[Any]], ...]  # column-at-a-time
+    excludes: tuple[tuple[int, set[Any]], ...]  # (column index, excludes); usually empty
+    # columns with not_null or a custom validator; everything else skips Column.validate
+    checked: tuple[Column[Any], ...]
+    build_row: Callable[[Sequence[Any]], Any]  # parsed row -> model instance
+
+
+def _make_row_builder(
+    model: type[Any], storage_names: tuple[str, ...]
+) -> Callable[[Sequence[Any]], Any]:
+    # same idea as dataclasses' generated __init__: unroll the per-column loop into
+    # straight-line code, with everything it touches bound as fast locals
+    stores = "".join(
+        f"    obj.{attr} = row[{i}]\n"
+        if attr.isidentifier()
+        else f"    _setattr(obj, {attr!r}, row[{i}])\n"  # e.g. a field added as "my-field"
+        for i, attr in enumerate(storage_names)
+    )
+    src = (
+        "def build_row(row, _new=_new, _model=_model, _setattr=_setattr):\n"
+        "    obj = _new(_model)\n"
+        f"{stores}"
+        "    return obj\n"
+    )
+    ns: dict[str, Any] = {"_new": model.__new__, "_model": model, "_setattr": setattr}
+    exec(src, ns)
+    return ns["build_row"]
+
+
+@cache
+def _model_plan(model: type[Any]) -> _ModelPlan:
+    cols = _get_model_columns(model)
+    for col in cols:
+        if getattr(col, "name", None) is None:
+            raise RuntimeError("Column __set_name__ did not run.")
+
+    return _ModelPlan(
+        columns=cols,
+        defaults=tuple(c.spec.default for c in cols),
+        parsers=tuple(c.parse_cells for c in cols),
+        excludes=tuple((i, c.spec.excludes) for i, c in enumerate(cols) if c.spec.excludes),
+        checked=tuple(c for c in cols if c.spec.not_null or c.spec.validator is not _no_validation),
+        build_row=_make_row_builder(model, tuple(c.storage_name for c in cols)),
+    )
 
 
 def _normalize_header(v: Any) -> str:
@@ -45,19 +107,27 @@ def _normalize_header(v: Any) -> str:
     return str(v).strip()
 
 
-def _row_is_blank(values: list[Any]) -> bool:
-    return all(_normalize_header(v) == "" for v in values)
+def _index_header_runs(header: list[str]) -> dict[tuple[str, ...], int]:
+    """Map each contiguous run of non-blank headers to its 1-based starting column."""
+    runs: dict[tuple[str, ...], int] = {}
+    start: int | None = None
+    for i, h in enumerate([*header, ""]):
+        if h and start is None:
+            start = i
+        elif not h and start is not None:
+            runs.setdefault(tuple(header[start:i]), start + 1)
+            start = None
+    return runs
+
+
+def _row_is_blank(values: Sequence[Any]) -> bool:
+    # only strings can be "blank but not None"; other values are checked without str()
+    return not any(v is not None and (not isinstance(v, str) or v.strip()) for v in values)
 
 
 def _instantiate_model[M](model: type[M]) -> M:
-    obj = model.__new__(model)
-    obj._values = {}
-    # defaults
-    for col in _get_model_columns(model):
-        if col.name is None:
-            raise RuntimeError("Column __set_name__ did not run.")
-        obj._values[col.name] = col.spec.default
-    return obj
+    plan = _model_plan(model)
+    return plan.build_row(plan.defaults)
 
 
 class Repository(list[M]):
@@ -174,83 +244,145 @@ class ExcelFile:
                 cell = ws.cell(row=spec.header_row, column=c, value=h)
                 cell.font = header_font
 
-                col_letter = ws.cell(row=spec.header_row, column=c).column_letter
-                ws.column_dimensions[col_letter].width = max(12, min(40, len(str(h)) + 4))
+                ws.column_dimensions[get_column_letter(c)].width = max(12, min(40, len(str(h)) + 4))
 
             current_col = end_col + 1 + spec.template_table_gap
 
     def load_data(self, filename: str) -> None:
-        wb = load_workbook(filename=filename, data_only=True)
-        for repo in self._repos.values():
-            repo.clear()
-
-        for sheet_spec in self.sheets:
-            if sheet_spec.name not in wb.sheetnames:
-                raise ValueError(f"Workbook missing sheet '{sheet_spec.name}'")
-            ws = wb[sheet_spec.name]
-            if isinstance(sheet_spec, PivotSheetSpec):
-                self._parse_pivot_sheet(ws, sheet_spec)
-            else:
-                self._parse_sheet(ws, sheet_spec)
+        # read_only streams rows from the xml instead of building the full cell DOM
+        wb = load_workbook(filename=filename, data_only=True, read_only=True)
+        try:
+            for repo in self._repos.values():
+                repo.clear()
+
+            for sheet_spec in self.sheets:
+                if sheet_spec.name not in wb.sheetnames:
+                    raise ValueError(f"Workbook missing sheet '{sheet_spec.name}'")
+                ws = wb[sheet_spec.name]
+                # read-only sizes rows from the sheet's <dimension> tag, which some writers
+                # leave stale (e.g. "A1"); drop it so rows are read as they actually are
+                ws.reset_dimensions()
+                if isinstance(sheet_spec, PivotSheetSpec):
+                    self._parse_pivot_sheet(ws, sheet_spec)
+                else:
+                    self._parse_sheet(ws, sheet_spec)
+        finally:
+            # read-only workbooks keep the zip handle open until closed
+            wb.close()
 
     def _parse_sheet(self, ws: Worksheet, spec: SheetSpec) -> None:
+        # read and normalize the header row once; every model on the sheet searches it
+        r = spec.header_row
+        header = [
+            _normalize_header(v)
+            for v in next(ws.iter_rows(min_row=r, max_row=r, values_only=True), ())
+        ]
+
+        runs = _index_header_runs(header)
+
+        # (model, plan, window into the row tuple, buffered raw rows) for every table found
+        tables: list[tuple[type[Any], _ModelPlan, slice, list[tuple[Any, ...]]]] = []
         for model in spec.models:
-            found = self._find_header(ws, spec, model)
+            found = self._find_header(header, runs, spec, model)
             if found is None:
                 continue
 
             _, start_col = found
-            cols = _get_model_columns(model)
-            width = len(cols)
+            plan = _model_plan(model)
+            window = slice(start_col - 1, start_col - 1 + len(plan.columns))
+            tables.append((model, plan, window, []))
 
-            repo: Repository[Any] = self._repos[model]
+        if not tables:
+            return
 
-            r = spec.data_start_row
-            while r <= ws.max_row:
-                row_vals = [ws.cell(row=r, column=start_col + j).value for j in range(width)]
+        # stream the data rows once and slice each table's window out of the same tuple;
+        # a table stops at its first blank row, the sheet stops once every table has
+        active = list(tables)
+        max_col = max(window.stop for _, _, window, _ in tables)
+
+        for row in ws.iter_rows(min_row=spec.data_start_row, max_col=max_col, values_only=True):
+            for table in tuple(active):
+                _, _, window, rows = table
+                row_vals = row[window]
                 if _row_is_blank(row_vals):
-                    break
-
-                # excludes (raw-value based)
-                if any(
-                    col.spec.excludes and row_vals[i] in col.spec.excludes
-                    for i, col in enumerate(cols)
-                ):
-                    r += 1
+                    active.remove(table)
                     continue
 
-                obj = _instantiate_model(model)
-                for i, col in enumerate(cols):
-                    raw = row_vals[i]
-                    parsed = col.parse_cell(raw)
-                    setattr(obj, col.name, parsed)
+                rows.append(row_vals)
 
-                validate = getattr(obj, "validate", None)
-                if callable(validate):
-                    validate()
+            if not active:
+                break
 
-                repo.append(obj)
-                r += 1
+        for model, plan, _, rows in tables:
+            self._load_rows(model, plan, rows)
+
+    def _load_rows(self, model: type[Any], plan: _ModelPlan, rows: list[tuple[Any, ...]]) -> None:
+        if not rows:
+            return
+
+        # transpose the buffered rows into one tuple per column
+        raw_columns = list(zip(*rows, strict=True))
+
+        # excludes (raw-value based): one keep-mask built from the excludes-bearing columns
+        keep: list[bool] | None = None
+        for i, excludes in plan.excludes:
+            col_keep = [raw not in excludes for raw in raw_columns[i]]
+            keep = col_keep if keep is None else list(map(operator.and_, keep, col_keep))
+        if keep is not None:
+            raw_columns = [tuple(compress(raws, keep)) for raws in raw_columns]
+
+        # parse column-at-a-time so each parser sees its whole column, then rebuild the rows
+        parsed_columns = [
+            parse(raws) for parse, raws in zip(plan.parsers, raw_columns, strict=True)
+        ]
+
+        repo: Repository[Any] = self._repos[model]
+        build_row = plan.build_row
+        parsed_rows = zip(*parsed_columns, strict=True)
+
+        # nothing to check per row: build and store the whole table in one C-level extend
+        if not plan.checked and not callable(getattr(model, "validate", None)):
+            repo.extend(map(build_row, parsed_rows))
+            return
+
+        repo_append = repo.append
+        for parsed in parsed_rows:
+            # write straight into storage, then run the column checks once per row
+            obj = build_row(parsed)
+            for col in plan.checked:
+                col.validate(getattr(obj, col.storage_name))
+
+            validate = getattr(obj, "validate", None)
+            if callable(validate):
+                validate()
+
+            repo_append(obj)
 
     def _find_header(
-        self, ws: Worksheet, spec: SheetSpec, model: type[Any]
+        self,
+        header: list[str],
+        runs: dict[tuple[str, ...], int],
+        spec: SheetSpec,
+        model: type[Any],
     ) -> tuple[int, int] | None:
         cols = _get_model_columns(model)
         expected = [_normalize_header(c.spec.header) for c in cols]
         if not expected:
             return None
 
-        r = spec.header_row
         width = len(expected)
-        max_c = ws.max_column or 0
-
-        for start_col in range(1, max_c - width + 2):
-            actual = [
-                _normalize_header(ws.cell(row=r, column=start_col + j).value) for j in range(width)
-            ]
-            if actual == expected:
-                return (r, start_col)
 
+        # common case: the table is its own blank-delimited run of headers. The leftmost
+        # match still wins, so only windows starting before that run need scanning; on a
+        # miss (adjacent tables, blank headers) the whole row is scanned.
+        start_col = runs.get(tuple(expected))
+        stop = start_col - 1 if start_col is not None else len(header) - width + 1
+        for i in range(stop):
+            if header[i : i + width] == expected:
+                return (spec.header_row, i + 1)
+
+        if start_col is not None:
+            return (spec.header_row, start_col)
         return None
 
     def _write_pivot_sheet_template(self, ws: Worksheet, spec: PivotSheetSpec) -> None:
@@ -284,8 +416,7 @@ class ExcelFile:
             cell = ws.cell(spec.header_row, c, pv)
             cell.font = header_font
 
-            col_letter = ws.cell(spec.header_row, c).column_letter
-            ws.column_dimensions[col_letter].width = 14
+            ws.column_dimensions[get_column_letter(c)].width = 14
 
         # Seed row keys (optional)
         if spec.row_values:
@@ -309,32 +440,39 @@ class ExcelFile:
         val_col = cols[spec.value_field]
 
         # Determine pivot headers from sheet (or trust spec.pivot_values)
+        header = next(
+            ws.iter_rows(
+                min_row=spec.header_row,
+                max_row=spec.header_row,
+                min_col=spec.data_start_col,
+                values_only=True,
+            ),
+            (),
+        )
         pivot_headers: list[Any] = []
-        j = 0
-        while True:
-            c = spec.data_start_col + j
-            raw = ws.cell(spec.header_row, c).value
+        for raw in header:
             if raw is None or str(raw).strip() == "":
                 break
             pivot_headers.append(pivot_col.parse_cell(raw))
-            j += 1
 
         if not pivot_headers:
             return
 
-        repo: Repository[Any] = self._repos[model]
+        repo_append = self._repos[model].append
 
-        r = spec.data_start_row
-        while r <= ws.max_row:
-            raw_row_key = ws.cell(r, spec.row_header_col).value
+        key_idx = spec.row_header_col - 1
+        val_start = spec.data_start_col - 1
+        max_col = max(spec.row_header_col, spec.data_start_col + len(pivot_headers) - 1)
+
+        for row in ws.iter_rows(min_row=spec.data_start_row, max_col=max_col, values_only=True):
+            raw_row_key = row[key_idx]
             if raw_row_key is None or str(raw_row_key).strip() == "":
                 break
 
             row_key = row_col.parse_cell(raw_row_key)
 
             for j, pivot_value in enumerate(pivot_headers):
-                c = spec.data_start_col + j
-                raw_val = ws.cell(r, c).value
+                raw_val = row[val_start + j]
                 if not spec.include_blanks and (raw_val is None or raw_val == ""):
                     continue
 
@@ -348,6 +486,4 @@ class ExcelFile:
                 if callable(validate):
                     validate()
 
-                repo.append(obj)
-
-            r += 1
+                repo_append(obj)
@@ -4,18 +4,30 @@ from datetime import date, datetime
 
 import pytest
 
-from src.excel_orm import Column, bool_column, date_column, int_column, text_column
+from src.excel_orm import Column, ColumnSpec, bool_column, date_column, int_column, text_column
 
 
-def test_descriptor_stores_in_values_dict():
+def test_descriptor_stores_in_per_field_attribute():
     class Foo:
         a: Column[str] = text_column(header="A")
 
     f = Foo()
-    f._values = {}  # ty:ignore[unresolved-attribute]
+    assert f.a is None
+
+    f.a = "hello"
+    assert f._col_a == "hello"  # ty:ignore[unresolved-attribute]
+    assert f.a == "hello"
+
+
+def test_descriptor_works_with_slotted_models():
+    class Foo:
+        __slots__ = ("_col_a",)
+        a: Column[str] = text_column(header="A")
+
+    f = Foo()
+    assert f.a is None
 
     f.a = "hello"
-    assert f._values["a"] == "hello"  # ty:ignore[unresolved-attribute]
     assert f.a == "hello"
 
 
@@ -26,12 +38,37 @@ def test_descriptor_class_level_access_returns_column():
     assert isinstance(Foo.a, Column)
 
 
+def test_descriptor_storage_does_not_collide_with_underscored_field():
+    class Foo:
+        x: Column[str] = text_column(header="X")
+        _x: Column[str] = text_column(header="_X")
+
+    f = Foo()
+    f.x = "one"
+    f._x = "two"
+    assert (f.x, f._x) == ("one", "two")
+
+
+def test_descriptor_storage_name_already_defined_raises():
+    with pytest.raises(ValueError, match="_col_a"):
+
+        class Foo:
+            a: Column[str] = text_column(header="A")
+
+            def _col_a(self) -> None: ...
+
+    with pytest.raises(ValueError, match="_col_a"):
+
+        class Bar:
+            a: Column[str] = text_column(header="A")
+            _col_a: Column[str] = text_column(header="B")
+
+
 def test_not_null_validation_raises_on_none_or_empty():
     class Foo:
         a: Column[str] = text_column(header="A", not_null=True)
 
     f = Foo()
-    f._values = {}  # ty:ignore[unresolved-attribute]
 
     with pytest.raises(ValueError):
         f.a = None  # type: ignore[assignment]
@@ -46,6 +83,9 @@ def test_text_column_strip_and_none_to_empty_string():
     assert col.parse_cell("  hi  ") == "hi"
     assert col.parse_cell(123) == "123"
 
+    clean = "already clean"
+    assert col.parse_cell(clean) is clean
+
 
 def test_text_column_no_strip():
     col = text_column(header="X", strip=False)
@@ -68,12 +108,24 @@ def test_bool_column_parsing_valid_values():
     assert col.parse_cell("YES") is True
     assert col.parse_cell("0") is False
     assert col.parse_cell("n") is False
+    assert col.parse_cell(" Yes ") is True
+    assert col.parse_cell(1) is True
+    assert col.parse_cell(0) is False
 
 
 def test_bool_column_invalid_raises():
     col = bool_column(header="B")
     with pytest.raises(ValueError):
         col.parse_cell("maybe")
+    with pytest.raises(ValueError):
+        col.parse_cell(2)
+    # only None / "" are blank; whitespace-only strings and float cells are not accepted
+    with pytest.raises(ValueError):
+        col.parse_cell(" ")
+    with pytest.raises(ValueError):
+        col.parse_cell(1.0)
+    with pytest.raises(ValueError):
+        col.parse_cell(0.0)
 
 
 @pytest.mark.parametrize(
@@ -84,6 +136,9 @@ def test_bool_column_invalid_raises():
         ("2025-06-01", date(2025, 6, 1)),
         ("2025/06/01", date(2025, 6, 1)),
         ("06/01/2025", date(2025, 6, 1)),  # per your formats list (US)
+        ("13/06/2025", date(2025, 6, 13)),  # not a valid US date -> day-first
+        ("01 JUN 25", date(2025, 6, 1)),
+        ("  01-Jun-25  ", date(2025, 6, 1)),
         (datetime(2025, 6, 1, 12, 30), date(2025, 6, 1)),
         (date(2025, 6, 1), date(2025, 6, 1)),
         ("2025-06-01T13:45:00", date(2025, 6, 1)),  # ISO datetime
@@ -108,3 +163,47 @@ def test_date_column_invalid_raises():
     col = date_column(header="D")
     with pytest.raises(ValueError):
         col.parse_cell("not-a-date")
+
+
+def test_parse_cells_uses_batch_parser_and_matches_per_cell():
+    col = date_column(header="D")
+    raws = ["01-JUN-2025", date(2025, 7, 1), "01-JUN-2025", "2025-08-01"]
+    assert col.parse_cells(raws) == [col.parse_cell(r) for r in raws]
+
+    with pytest.raises(ValueError):
+        col.parse_cells(["01-JUN-2025", "not-a-date"])
+
+
+def test_parse_cells_falls_back_to_per_cell_parser():
+    col = Column(ColumnSpec[int](header="Y", parser=lambda raw: int(raw) * 2))
+    assert col.parse_cells(["1", 2]) == [2, 4]
+
+
+def test_parse_cells_numeric_columns_match_per_cell():
+    ints = int_column(header="Y")
+    raws = [None, "", "42", 7, 7.0, True]
+    assert ints.parse_cells(raws) == [ints.parse_cell(r) for r in raws]
+
+    bools = bool_column(header="B")
+    raws = [True, False, None, "yes", 0]
+    assert bools.parse_cells(raws) == [bools.parse_cell(r) for r in raws]
+
+
+def test_column_spec_positional_construction_is_stable():
+    def render(v):
+        return f"R{v}"
+
+    def validate(v):
+        return None
+
+    spec = ColumnSpec("H", None, False, None, int, render, validate)
+    assert (spec.parser, spec.renderer, spec.validator) == (int, render, validate)
+    assert Column(spec).parse_cells(["1"]) == [1]
+
+
+def test_parse_cells_follows_a_replaced_parser():
+    from dataclasses import replace
+
+    col = Column(replace(int_column("X").spec, parser=lambda raw: 99))
+    assert col.parse_cell("1") == 99
+    assert col.parse_cells(["1"]) == [99]
@@ -230,3 +230,208 @@ def test_load_data_missing_pivot_sheet_raises(tmp_path, pivot_excel_file):
 
     with pytest.raises(ValueError):
         pivot_excel_file.load_data(str(p))
+
+
+def test_load_data_tables_on_same_sheet_stop_independently(tmp_path, excel_file):
+    out = tmp_path / "uneven.xlsx"
+    excel_file.generate_template(str(out))
+
+    wb = load_workbook(out)
+    ws = wb["Cars"]
+
+    # Cars has a single row; plants keep going below the end of the cars table
+    ws["A3"].value = "Toyota"
+    ws["B3"].value = "Camry"
+    ws["C3"].value = 2020
+
+    ws["F3"].value = "Plant 1"
+    ws["F4"].value = "Plant 2"
+    ws["F5"].value = "Plant 3"
+
+    # cars stopped at row 4, so this row must not be read
+    ws["A5"].value = "Honda"
+    ws["B5"].value = "Civic"
+    ws["C5"].value = 2019
+
+    wb.save(out)
+
+    excel_file.load_data(str(out))
+
+    assert [c.make for c in excel_file.cars.all()] == ["Toyota"]
+    assert [p.name for p in excel_file.manufacturing_plants.all()] == [
+        "Plant 1",
+        "Plant 2",
+        "Plant 3",
+    ]
+
+
+def test_load_data_enforces_not_null_columns(tmp_path, excel_file):
+    out = tmp_path / "not_null.xlsx"
+    excel_file.generate_template(str(out))
+
+    wb = load_workbook(out)
+    ws = wb["Cars"]
+
+    # make is not_null; a missing value parses to "" and must be rejected
+    ws["B3"].value = "Camry"
+    ws["C3"].value = 2020
+
+    wb.save(out)
+
+    with pytest.raises(ValueError, match="make"):
+        excel_file.load_data(str(out))
+
+
+def test_load_data_skips_excluded_rows(tmp_path):
+    from excel_orm import Column, ColumnSpec, SheetSpec, text_column
+
+    class Part:
+        name: Column[str] = text_column(header="Name")
+        status: Column[str] = Column(ColumnSpec[str](header="Status", excludes={"IGNORE", "SKIP"}))
+        qty: Column[int] = Column(ColumnSpec[int](header="Qty", excludes={0}))
+
+    xf = ExcelFile(sheets=[SheetSpec(name="Parts", models=[Part])])
+
+    out = tmp_path / "excludes.xlsx"
+    xf.generate_template(str(out))
+
+    wb = load_workbook(out)
+    ws = wb["Parts"]
+    rows = [
+        ("bolt", "OK", 5),
+        ("nut", "IGNORE", 3),
+        ("gear", "OK", 0),
+        ("cog", "SKIP", 0),
+        ("axle", "OK", 2),
+    ]
+    for r, values in enumerate(rows, start=3):
+        for c, v in enumerate(values, start=1):
+            ws.cell(row=r, column=c, value=v)
+    wb.save(out)
+
+    xf.load_data(str(out))
+
+    assert [(p.name, p.qty) for p in xf.parts.all()] == [("bolt", 5), ("axle", 2)]  # ty:ignore[unresolved-attribute]
+
+
+def test_load_data_calls_model_validate(tmp_path):
+    from excel_orm import Column, SheetSpec, int_column
+
+    class Engine:
+        cylinders: Column[int] = int_column(header="Cylinders")
+
+        def validate(self) -> None:
+            if self.cylinders > 16:
+                raise ValueError("too many cylinders")
+
+    xf = ExcelFile(sheets=[SheetSpec(name="Engines", models=[Engine])])
+
+    out = tmp_path / "validate.xlsx"
+    xf.generate_template(str(out))
+
+    wb = load_workbook(out)
+    ws = wb["Engines"]
+    ws["A3"].value = 8
+    ws["A4"].value = 32
+    wb.save(out)
+
+    with pytest.raises(ValueError, match="cylinders"):
+        xf.load_data(str(out))
+
+
+def test_load_data_adjacent_tables_without_gap(tmp_path, models):
+    from excel_orm import SheetSpec
+
+    Car, ManufacturingPlant = models
+    xf = ExcelFile(
+        sheets=[SheetSpec(name="Cars", models=[Car, ManufacturingPlant], template_table_gap=0)]
+    )
+
+    out = tmp_path / "adjacent.xlsx"
+    xf.generate_template(str(out))
+
+    wb = load_workbook(out)
+    ws = wb["Cars"]
+    for c, v in enumerate(["Toyota", "Camry", 2020, "Plant 1", "NJ"], start=1):
+        ws.cell(row=3, column=c, value=v)
+    wb.save(out)
+
+    xf.load_data(str(out))
+
+    assert [c.model for c in xf.cars.all()] == ["Camry"]  # ty:ignore[unresolved-attribute]
+    assert [p.location for p in xf.manufacturing_plants.all()] == ["NJ"]  # ty:ignore[unresolved-attribute]
+
+
+def _set_sheet_dimension(path, ref: str) -> None:
+    """Rewrite the <dimension> tag of every worksheet, as some writers leave it stale."""
+    import re
+    import zipfile
+
+    with zipfile.ZipFile(path) as zin:
+        items = [(info, zin.read(info.filename)) for info in zin.infolist()]
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zout:
+        for info, data in items:
+            if info.filename.startswith("xl/worksheets/sheet"):
+                data = re.sub(rb'<dimension ref="[^"]*"', f'<dimension ref="{ref}"'.encode(), data)
+            zout.writestr(info, data)
+
+
+def test_load_data_ignores_stale_sheet_dimension(tmp_path, excel_file, pivot_excel_file):
+    out = tmp_path / "stale.xlsx"
+    excel_file.generate_template(str(out))
+
+    wb = load_workbook(out)
+    ws = wb["Cars"]
+    ws["A3"].value = "Toyota"
+    ws["B3"].value = "Camry"
+    ws["C3"].value = 2020
+    ws["F3"].value = "Plant 1"
+    wb.save(out)
+
+    _set_sheet_dimension(out, "A1")
+    excel_file.load_data(str(out))
+
+    assert [(c.make, c.year) for c in excel_file.cars.all()] == [("Toyota", 2020)]
+    assert [p.name for p in excel_file.manufacturing_plants.all()] == ["Plant 1"]
+
+    pivot_out = tmp_path / "stale_pivot.xlsx"
+    pivot_excel_file.generate_template(str(pivot_out))
+
+    wb = load_workbook(pivot_out)
+    wb["Demand"]["B3"].value = 10
+    wb.save(pivot_out)
+
+    _set_sheet_dimension(pivot_out, "A1")
+    pivot_excel_file.load_data(str(pivot_out))
+
+    assert [(r.region, r.dt, r.value) for r in pivot_excel_file.demands.all()] == [
+        ("NA", date(2025, 6, 1), 10)
+    ]
+
+
+def test_load_data_prefers_leftmost_header_match(tmp_path):
+    from openpyxl import Workbook
+
+    from excel_orm import Column, SheetSpec, int_column, text_column
+
+    class Vehicle:
+        make: Column[str] = text_column(header="Make")
+        year: Column[int] = int_column(header="Year")
+
+    xf = ExcelFile(sheets=[SheetSpec(name="Vehicles", models=[Vehicle])])
+
+    # the table at A has a user-added Notes column; an exact "Make, Year" run follows at E
+    out = tmp_path / "leftmost.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Vehicles"
+    for c, v in enumerate(["Make", "Year", "Notes", None, "Make", "Year"], start=1):
+        ws.cell(row=2, column=c, value=v)
+    for c, v in enumerate(["Toyota", 2020, "n/a", None, "Honda", 2019], start=1):
+        ws.cell(row=3, column=c, value=v)
+    wb.save(out)
+
+    xf.load_data(str(out))
+
+    assert [(v.make, v.year) for v in xf.vehicles.all()] == [("Toyota", 2020)]  # ty:ignore[unresolved-attribute]
@@ -5,9 +5,12 @@ from src.excel_orm.orm import (
     _camel_to_snake,
     _display_name_for_model,
     _get_model_columns,
+    _index_header_runs,
     _instantiate_model,
+    _model_plan,
     _pluralize,
     _repo_name_for_model,
+    _row_is_blank,
 )
 
 
@@ -30,6 +33,22 @@ def test_repo_and_display_name():
     assert _display_name_for_model(ManufacturingPlant) == "Manufacturing Plants"
 
 
+def test_index_header_runs():
+    header = ["", "Make", "Model", "", "", "Name", "Location", "Make", "Model"]
+    assert _index_header_runs(header) == {
+        ("Make", "Model"): 2,
+        ("Name", "Location", "Make", "Model"): 6,
+    }
+    assert _index_header_runs([]) == {}
+
+
+def test_row_is_blank():
+    assert _row_is_blank((None, "", "   "))
+    assert not _row_is_blank((None, 0))
+    assert not _row_is_blank(("", " x "))
+    assert _row_is_blank(())
+
+
 def test_get_model_columns_respects_annotation_order():
     class A:
         x: Column[str] = text_column(header="X")
@@ -39,9 +58,47 @@ def test_get_model_columns_respects_annotation_order():
     assert [c.name for c in cols] == ["x", "y"]
 
 
+def test_model_plan_flattens_columns_and_is_cached():
+    class A:
+        x: Column[str] = text_column(header="X", default="dflt")
+        y: Column[int] = int_column(header="Y")
+
+    plan = _model_plan(A)
+    assert [c.name for c in plan.columns] == ["x", "y"]
+    assert plan.defaults == ("dflt", None)
+    assert plan.parsers == (A.x.parse_cells, A.y.parse_cells)  # ty:ignore[unresolved-attribute]
+    assert plan.excludes == ()
+    assert _model_plan(A) is plan
+
+    a = plan.build_row(("hi", 3))
+    assert isinstance(a, A)
+    assert (a.x, a.y) == ("hi", 3)
+
+
+def test_row_builder_keeps_similarly_named_fields_apart():
+    class A:
+        x: Column[str] = text_column(header="X")
+        _x: Column[str] = text_column(header="_X")
+
+    a = _model_plan(A).build_row(("one", "two"))
+    assert (a.x, a._x) == ("one", "two")
+
+
+def test_row_builder_handles_non_identifier_field_names():
+    C = type("C", (), {"my-field": text_column(header="My Field")})
+
+    c = _model_plan(C).build_row(("hi",))
+    assert getattr(c, "my-field") == "hi"
+
+
 def test_instantiate_model_sets_defaults_and_requires_set_name():
     class A:
         x: Column[str] = text_column(header="X", default="dflt")
 
     a = _instantiate_model(A)
-    assert a._values["x"] == "dflt"  # ty:ignore[unresolved-attribute]
+    assert a.x == "dflt"
+
+    # defaults are per instance
+    b = _instantiate_model(A)
+    b.x = "changed"
+    assert a.x == "dflt"